@@ -19,7 +19,7 @@ import argparse
 import sys
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 import time
 
@@ -43,9 +43,16 @@ class EnhancedBrandMonitoringAPI:
     orchestration, ranking detection, and advanced analytics.
     """
     
-    def __init__(self, config_file: str = "config.yaml"):
-        """Initialize the enhanced API with configuration."""
+    def __init__(
+        self,
+        config_file: str = "config.yaml",
+        config_dict: Optional[Dict[str, Any]] = None,
+        credentials_info: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize the enhanced API with configuration (file path or pre-parsed dict)."""
         self.config_file = config_file
+        self.config_dict = config_dict
+        self.credentials_info = credentials_info
         self.settings = None
         self.workflow = None
         self.execution_history: List[Dict[str, Any]] = []
@@ -62,7 +69,11 @@ class EnhancedBrandMonitoringAPI:
         try:
             # Load and validate configuration
             logger.info("Loading enhanced configuration...")
-            self.settings = get_settings(self.config_file)
+            self.settings = get_settings(self.config_file, config_data=self.config_dict)
+            
+            # Use in-memory Google service account credentials when provided
+            if self.credentials_info is not None:
+                self.settings.google_sheets.credentials_info = self.credentials_info
             
             # Validate Stage 2 requirements
             validation = validate_stage2_requirements()
@@ -120,12 +131,19 @@ class EnhancedBrandMonitoringAPI:
         }
         
         try:
-            # Test agent connections
+            # Test agent connections concurrently
             if self.workflow and self.workflow.agents:
-                for agent_name, agent in self.workflow.agents.items():
+                agent_items = list(self.workflow.agents.items())
+                logger.info(f"Testing {len(agent_items)} agents concurrently...")
+                health_results = await asyncio.gather(
+                    *(agent.health_check() for _, agent in agent_items),
+                    return_exceptions=True
+                )
+                
+                for (agent_name, agent), health_status in zip(agent_items, health_results):
                     try:
-                        logger.info(f"Testing {agent_name} agent...")
-                        health_status = await agent.health_check()
+                        if isinstance(health_status, BaseException):
+                            raise health_status
                         
                         test_results["agents"][agent_name] = {
                             "available": True,
@@ -205,7 +223,8 @@ class EnhancedBrandMonitoringAPI:
         queries: List[str],
         mode: str = "parallel",
         enable_ranking: bool = None,
-        enable_analytics: bool = None
+        enable_analytics: bool = None,
+        progress_callback: Optional[Callable[[str, Any], None]] = None
     ) -> Dict[str, Any]:
         """
         Monitor brand mentions across queries with enhanced Stage 2 features.
@@ -215,6 +234,7 @@ class EnhancedBrandMonitoringAPI:
             mode: Execution mode ("parallel" or "sequential")
             enable_ranking: Override ranking detection setting
             enable_analytics: Override analytics setting
+            progress_callback: Called with (query, query_state) as each query completes
             
         Returns:
             Dictionary with enhanced monitoring results
@@ -240,7 +260,8 @@ class EnhancedBrandMonitoringAPI:
             workflow_state = await self.workflow.execute_enhanced_workflow(
                 queries=queries,
                 processing_mode=mode,
-                enable_analytics=enable_analytics
+                enable_analytics=enable_analytics,
+                progress_callback=progress_callback
             )
             
             # Generate enhanced results
@@ -13,6 +13,12 @@ from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Load environment variables
 load_dotenv()
 
@@ -30,6 +36,7 @@ class GoogleSheetsConfig(BaseModel):
     """Configuration for Google Sheets integration."""
     
     credentials_file: str = Field(default="credentials.json")
+    credentials_info: Optional[Dict[str, Any]] = None  # Service account info, used instead of credentials_file
     spreadsheet_id: str = ""
     worksheet_name: str = "Brand_Monitoring"
     auto_setup_headers: bool = True
@@ -213,14 +220,15 @@ class Settings(BaseSettings):
         case_sensitive = False
         extra = "allow"
     
-    def __init__(self, config_file: str = "config.yaml", **kwargs):
-        """Initialize settings from config file and environment variables."""
+    def __init__(self, config_file: str = "config.yaml", config_data: Optional[Dict[str, Any]] = None, **kwargs):
+        """Initialize settings from config file (or pre-parsed config data) and environment variables."""
         
-        # Load from YAML config file if it exists
-        config_data = {}
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
+        # Load from YAML config file if it exists, unless the config was passed in-memory
+        if config_data is None:
+            config_data = {}
+            if os.path.exists(config_file):
+                with open(config_file, 'r') as f:
+                    config_data = yaml.load(f, Loader=YamlLoader) or {}
         
         # Process LLM configurations with environment variable overrides
         merged_llm_configs = self._process_llm_configs(config_data)
@@ -254,6 +262,7 @@ class Settings(BaseSettings):
                     spreadsheet_id=env_spreadsheet_id,
                     worksheet_name=self.google_sheets.worksheet_name,
                     credentials_file=self.google_sheets.credentials_file,
+                    credentials_info=self.google_sheets.credentials_info,
                     auto_setup_headers=self.google_sheets.auto_setup_headers,
                     batch_size=self.google_sheets.batch_size,
                     enable_validation=self.google_sheets.enable_validation
@@ -361,6 +370,7 @@ class Settings(BaseSettings):
             spreadsheet_id=spreadsheet_id,
             worksheet_name=yaml_gs.get("worksheet_name", "Brand_Monitoring"),
             credentials_file=yaml_gs.get("credentials_file", "credentials.json"),
+            credentials_info=yaml_gs.get("credentials_info"),
             auto_setup_headers=yaml_gs.get("auto_setup_headers", True),
             batch_size=yaml_gs.get("batch_size", 100),
             enable_validation=yaml_gs.get("enable_validation", True)
@@ -459,6 +469,7 @@ class Settings(BaseSettings):
                 spreadsheet_id=env_spreadsheet_id,
                 worksheet_name=self.google_sheets.worksheet_name,
                 credentials_file=self.google_sheets.credentials_file,
+                credentials_info=self.google_sheets.credentials_info,
                 auto_setup_headers=self.google_sheets.auto_setup_headers,
                 batch_size=self.google_sheets.batch_size,
                 enable_validation=self.google_sheets.enable_validation
@@ -472,11 +483,16 @@ class Settings(BaseSettings):
 # Global settings instance
 settings = None
 
-def get_settings(config_file: str = "config.yaml") -> Settings:
-    """Get or create the global settings instance."""
+def get_settings(config_file: str = "config.yaml", config_data: Optional[Dict[str, Any]] = None) -> Settings:
+    """Get or create the global settings instance.
+    
+    When config_data is given, the global instance is rebuilt from it so an
+    in-memory configuration replaces any settings created earlier (e.g. by
+    logging setup at import time).
+    """
     global settings
-    if settings is None:
-        settings = Settings(config_file=config_file)
+    if settings is None or config_data is not None:
+        settings = Settings(config_file=config_file, config_data=config_data)
     return settings
 
 def reload_settings(config_file: str = "config.yaml") -> Settings:
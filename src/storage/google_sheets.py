@@ -110,11 +110,18 @@ class EnhancedGoogleSheetsManager:
         try:
             # Use the simpler gspread service account method
             loop = asyncio.get_event_loop()
-            self._client = await loop.run_in_executor(
-                None, 
-                gspread.service_account, 
-                self.config.credentials_file
-            )
+            if self.config.credentials_info:
+                self._client = await loop.run_in_executor(
+                    None,
+                    gspread.service_account_from_dict,
+                    self.config.credentials_info
+                )
+            else:
+                self._client = await loop.run_in_executor(
+                    None, 
+                    gspread.service_account, 
+                    self.config.credentials_file
+                )
             
             logger.debug("Google Sheets authentication successful")
             return True
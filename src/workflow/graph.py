@@ -13,6 +13,7 @@ import os
 
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
+from langchain_core.runnables import RunnableConfig
 
 from src.workflow.state import (
     WorkflowState, QueryState, AgentResult, AgentStatus,
@@ -147,7 +148,8 @@ class EnhancedBrandMonitoringWorkflow:
         """Initialize enhanced Google Sheets storage manager."""
         try:
             gs_cfg = self.config.google_sheets
-            if not gs_cfg.spreadsheet_id or not os.path.exists(gs_cfg.credentials_file):
+            has_credentials = bool(gs_cfg.credentials_info) or os.path.exists(gs_cfg.credentials_file)
+            if not gs_cfg.spreadsheet_id or not has_credentials:
                 logger.warning("Google Sheets not configured or credentials missing; storage disabled")
                 self.storage_manager = None
                 return True
@@ -581,7 +583,7 @@ class EnhancedBrandMonitoringWorkflow:
         
         return min(quality_score, 1.0)
     
-    async def _enhanced_store_results_node(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def _enhanced_store_results_node(self, state: Dict[str, Any], config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
         """Enhanced storage with Stage 2 data."""
         workflow_state = dict_to_state(state)
         current_query = workflow_state.queries[workflow_state.current_query_index]
@@ -608,11 +610,23 @@ class EnhancedBrandMonitoringWorkflow:
             logger.error(f"Failed to store enhanced results: {str(e)}")
             # Continue execution even if storage fails
         
+        # Report the completed query to the caller, if requested
+        self._report_progress(config, current_query, workflow_state.get_query_state(current_query))
+        
         # Move to next query
         workflow_state.current_query_index += 1
         
         return state_to_dict(workflow_state)
     
+    def _report_progress(self, config: Optional[RunnableConfig], query: str, query_state: QueryState):
+        """Pass a finished query to the progress callback from the run config, if any."""
+        progress_callback = (config or {}).get("configurable", {}).get("progress_callback")
+        if progress_callback:
+            try:
+                progress_callback(query, query_state)
+            except Exception as e:
+                logger.warning(f"Progress callback failed for query {query}: {str(e)}")
+    
     async def _enhanced_finalize_node(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Enhanced finalization with Stage 2 analytics."""
         workflow_state = dict_to_state(state)
@@ -658,7 +672,7 @@ class EnhancedBrandMonitoringWorkflow:
         
         return state_to_dict(workflow_state)
     
-    async def _handle_error_node(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_error_node(self, state: Dict[str, Any], config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
         """Enhanced error handling with recovery strategies."""
         workflow_state = dict_to_state(state)
         
@@ -675,6 +689,15 @@ class EnhancedBrandMonitoringWorkflow:
             logger.info(f"Recovery possible with agents: {available_agents}")
             # Could implement agent health checks and selective retry here
         
+        # Skip the current query so the workflow can reach finalize, and report it as done
+        if workflow_state.current_query_index < len(workflow_state.queries):
+            current_query = workflow_state.queries[workflow_state.current_query_index]
+            query_state = workflow_state.get_query_state(current_query)
+            if query_state:
+                query_state.status = AgentStatus.SKIPPED
+            self._report_progress(config, current_query, query_state)
+            workflow_state.current_query_index += 1
+        
         return state_to_dict(workflow_state)
     
     # Enhanced public interface methods
@@ -682,7 +705,8 @@ class EnhancedBrandMonitoringWorkflow:
         self, 
         queries: List[str], 
         processing_mode: str = "parallel",
-        enable_analytics: bool = None
+        enable_analytics: bool = None,
+        progress_callback: Optional[Callable[[str, QueryState], None]] = None
     ) -> WorkflowState:
         """
         Execute the enhanced workflow for a list of queries with Stage 2 features.
@@ -691,6 +715,7 @@ class EnhancedBrandMonitoringWorkflow:
             queries: List of search queries to process
             processing_mode: "parallel" or "sequential" execution
             enable_analytics: Override analytics setting
+            progress_callback: Called with (query, query_state) as each query completes
             
         Returns:
             Final workflow state with all results and analytics
@@ -712,7 +737,7 @@ class EnhancedBrandMonitoringWorkflow:
                 queries=queries,
                 target_agents=list(self.agents.keys()),
                 processing_mode=processing_mode,
-                config_snapshot=self.config.model_dump() if hasattr(self.config, 'model_dump') else None,
+                config_snapshot=self.config.model_dump(exclude={"google_sheets": {"credentials_info"}}) if hasattr(self.config, 'model_dump') else None,
                 workflow_id=str(uuid.uuid4()),
                 start_time=datetime.now()
             )
@@ -721,7 +746,7 @@ class EnhancedBrandMonitoringWorkflow:
             thread_id = str(uuid.uuid4())
             final_state_dict = await self.graph.ainvoke(
                 state_to_dict(initial_state),
-                config={"configurable": {"thread_id": thread_id}}
+                config={"configurable": {"thread_id": thread_id, "progress_callback": progress_callback}}
             )
             
             final_state = dict_to_state(final_state_dict)
@@ -10,19 +10,33 @@ import streamlit as st
 import asyncio
 import sys
 import os
-import tempfile
+import threading
+import queue
+import time
 import json
+import hashlib
+import copy
 from pathlib import Path
-import pandas as pd
+from collections import OrderedDict
 from datetime import datetime
-import time
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from main import EnhancedBrandMonitoringAPI
 from src.utils.logger import setup_logging
 
+# Use uvloop for the app's event loop when available (not supported on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Use orjson for JSON parsing/serialization when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 setup_logging(log_level="INFO")
 
@@ -35,7 +49,7 @@ st.set_page_config(
 )
 
 # Custom CSS for modern styling
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -59,18 +73,6 @@ st.markdown("""
         color: #ffc107;
         font-weight: bold;
     }
-    .metric-card {
-        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        padding: 1.5rem;
-        border-radius: 1rem;
-        border-left: 5px solid #1f77b4;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        transition: transform 0.2s;
-    }
-    .metric-card:hover {
-        transform: translateY(-2px);
-    }
     .agent-status {
         display: inline-block;
         padding: 0.5rem 1rem;
@@ -122,41 +124,55 @@ st.markdown("""
         background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def _minified_css():
+    """Collapse the stylesheet's whitespace once per process."""
+    return " ".join(_CSS.split())
+
+# The stylesheet is re-sent on every rerun, so keep the payload small
+st.html(_minified_css())
 
 # Initialize session state
-if 'api' not in st.session_state:
-    st.session_state.api = None
-if 'initialized' not in st.session_state:
-    st.session_state.initialized = False
+if 'secrets_status' not in st.session_state:
+    st.session_state.secrets_status = None
 if 'last_results' not in st.session_state:
     st.session_state.last_results = None
+if 'last_results_ts' not in st.session_state:
+    st.session_state.last_results_ts = None
+if 'last_results_reused' not in st.session_state:
+    st.session_state.last_results_reused = False
+if 'agent_names_tuple' not in st.session_state:
+    st.session_state.agent_names_tuple = None
+if 'result_cache' not in st.session_state:
+    st.session_state.result_cache = OrderedDict()
+
+# Maximum number of monitoring runs kept per session
+RESULT_CACHE_SIZE = 32
 
+REQUIRED_SECRETS = (
+    "OPENAI_API_KEY",
+    "PERPLEXITY_API_KEY",
+    "GEMINI_API_KEY",
+    "GOOGLE_SHEETS_SPREADSHEET_ID",
+    "GOOGLE_SERVICE_ACCOUNT_CREDENTIALS"
+)
+
+@st.cache_data(ttl=300, show_spinner=False)
 def check_streamlit_secrets():
     """Check if all required Streamlit secrets are configured."""
-    required_secrets = [
-        "OPENAI_API_KEY",
-        "PERPLEXITY_API_KEY", 
-        "GEMINI_API_KEY",
-        "GOOGLE_SHEETS_SPREADSHEET_ID",
-        "GOOGLE_SERVICE_ACCOUNT_CREDENTIALS"
-    ]
-    
-    missing_secrets = []
-    configured_secrets = []
-    
-    for secret in required_secrets:
-        if secret in st.secrets and st.secrets[secret]:
-            configured_secrets.append(secret)
-        else:
-            missing_secrets.append(secret)
+    configured_secrets = [secret for secret in REQUIRED_SECRETS if st.secrets.get(secret)]
+    present = set(configured_secrets)
+    missing_secrets = [secret for secret in REQUIRED_SECRETS if secret not in present]
     
     return {
-        "all_configured": len(missing_secrets) == 0,
+        "all_configured": not missing_secrets,
         "missing_secrets": missing_secrets,
         "configured_secrets": configured_secrets
     }
 
+@st.cache_data(ttl=300, show_spinner=False)
 def debug_secrets():
     """Debug function to check what secrets are available."""
     debug_info = {
@@ -164,7 +180,7 @@ def debug_secrets():
         "secret_lengths": {}
     }
     
-    for secret_name in ["OPENAI_API_KEY", "PERPLEXITY_API_KEY", "GEMINI_API_KEY", "GOOGLE_SHEETS_SPREADSHEET_ID", "GOOGLE_SERVICE_ACCOUNT_CREDENTIALS"]:
+    for secret_name in REQUIRED_SECRETS:
         if secret_name in st.secrets:
             secret_value = st.secrets[secret_name]
             if isinstance(secret_value, str):
@@ -176,31 +192,137 @@ def debug_secrets():
     
     return debug_info
 
-def create_credentials_file():
-    """Create credentials.json file from Streamlit secrets."""
-    try:
-        credentials_json = st.secrets.get("GOOGLE_SERVICE_ACCOUNT_CREDENTIALS", "")
-        if credentials_json:
-            # Create credentials file in current directory
-            credentials_path = "credentials.json"
-            with open(credentials_path, 'w') as f:
-                f.write(credentials_json)
-            return credentials_path
-        return None
-    except Exception as e:
-        st.error(f"Error creating credentials file: {str(e)}")
-        return None
+@st.cache_data(show_spinner=False)
+def _render_secret_badges(configured: tuple, missing: tuple) -> str:
+    """Build the secret status badges HTML."""
+    return "".join(
+        f'<div class="secret-status secret-ok">✅ {secret}</div>' for secret in configured
+    ) + "".join(
+        f'<div class="secret-status secret-missing">❌ {secret}</div>' for secret in missing
+    )
 
-def create_config_from_secrets():
-    """Create config.yaml content from Streamlit secrets."""
-    
-    # Validate API keys
-    openai_key = st.secrets.get('OPENAI_API_KEY', '')
-    perplexity_key = st.secrets.get('PERPLEXITY_API_KEY', '')
-    gemini_key = st.secrets.get('GEMINI_API_KEY', '')
-    spreadsheet_id = st.secrets.get('GOOGLE_SHEETS_SPREADSHEET_ID', '')
-    credentials_json = st.secrets.get('GOOGLE_SERVICE_ACCOUNT_CREDENTIALS', '')
-    
+def _parse_credentials_secret(credentials):
+    """Return service account info from a JSON string or a secrets.toml table."""
+    if isinstance(credentials, str):
+        if orjson is not None:
+            return orjson.loads(credentials)
+        return json.loads(credentials)
+    return dict(credentials)
+
+@st.cache_resource(show_spinner=False)
+def get_credentials_info():
+    """Load the Google service account credentials from Streamlit secrets."""
+    return _parse_credentials_secret(st.secrets["GOOGLE_SERVICE_ACCOUNT_CREDENTIALS"])
+
+# Config template filled from Streamlit secrets
+_CONFIG_TEMPLATE = {
+    # LLM Configurations
+    "llm_configs": {
+        "openai": {
+            "name": "openai",
+            "api_key": "",
+            "model": "gpt-3.5-turbo",
+            "max_tokens": 1000,
+            "temperature": 0.1,
+            "timeout": 30
+        },
+        "perplexity": {
+            "name": "perplexity",
+            "api_key": "",
+            "model": "sonar",
+            "max_tokens": 1000,
+            "temperature": 0.1,
+            "timeout": 30
+        },
+        "gemini": {
+            "name": "gemini",
+            "api_key": "",
+            "model": "gemini-pro",
+            "max_tokens": 1000,
+            "temperature": 0.1,
+            "timeout": 30
+        }
+    },
+    # Google Sheets Configuration
+    "google_sheets": {
+        "spreadsheet_id": "",
+        "worksheet_name": "Brand_Monitoring_New",
+        "auto_setup_headers": True,
+        "batch_size": 100,
+        "enable_validation": True
+    },
+    # Brand Configuration
+    "brand": {
+        "target_brand": "DataTobiz",
+        "brand_variations": [
+            "DataTobiz",
+            "Data Tobiz",
+            "data tobiz",
+            "DATATOBIZ",
+            "DataToBiz",
+            "Data-Tobiz",
+            "datatobiz.com"
+        ],
+        "case_sensitive": False,
+        "partial_match": True
+    },
+    # Workflow Configuration
+    "workflow": {
+        "max_retries": 3,
+        "retry_delay": 1.0,
+        "parallel_execution": True,
+        "timeout_per_agent": 60,
+        "log_level": "INFO"
+    },
+    # Stage 2 Configuration
+    "stage2": {
+        "enable_ranking_detection": True,
+        "enable_cost_tracking": True,
+        "enable_analytics": True,
+        "ranking_detection": {
+            "max_position": 20,
+            "min_confidence": 0.6,
+            "enable_ordinal_detection": True,
+            "enable_list_detection": True,
+            "enable_keyword_detection": True,
+            "enable_numeric_detection": True
+        }
+    },
+    # Enhanced Brand Configuration
+    "enhanced_brand": {
+        "context_analysis": {
+            "context_window": 200,
+            "enable_sentiment_analysis": False,
+            "positive_keywords": [
+                "excellent",
+                "outstanding",
+                "innovative",
+                "reliable",
+                "powerful",
+                "comprehensive",
+                "award-winning",
+                "recognized",
+                "trusted",
+                "proven"
+            ],
+            "negative_keywords": [
+                "poor",
+                "bad",
+                "disappointing",
+                "limited",
+                "lacking",
+                "outdated",
+                "problematic",
+                "difficult",
+                "complex",
+                "unreliable"
+            ]
+        }
+    }
+}
+
+def _validate_secrets(openai_key, perplexity_key, spreadsheet_id, credentials_json):
+    """Show format hints for the configured secrets."""
     # Check if keys are properly formatted
     if not openai_key.startswith('sk-'):
         st.warning("⚠️ OpenAI API key format may be incorrect (should start with 'sk-')")
@@ -223,122 +345,47 @@ def create_config_from_secrets():
         st.warning("⚠️ Google Service Account credentials are missing")
     else:
         try:
-            import json
-            creds_data = json.loads(credentials_json)
+            creds_data = _parse_credentials_secret(credentials_json)
             if 'client_email' not in creds_data:
                 st.warning("⚠️ Google Service Account credentials appear to be invalid (missing client_email)")
             else:
                 st.success(f"✅ Google Service Account configured for: {creds_data['client_email']}")
         except json.JSONDecodeError:
             st.warning("⚠️ Google Service Account credentials are not valid JSON")
+
+@st.cache_data(show_spinner=False)
+def _build_config(openai_key, perplexity_key, gemini_key, spreadsheet_id) -> dict:
+    """Build the config dict for the given secret values."""
+    config = copy.deepcopy(_CONFIG_TEMPLATE)
+    config["llm_configs"]["openai"]["api_key"] = openai_key
+    config["llm_configs"]["perplexity"]["api_key"] = perplexity_key
+    config["llm_configs"]["gemini"]["api_key"] = gemini_key
+    config["google_sheets"]["spreadsheet_id"] = spreadsheet_id
+    return config
+
+def show_secret_diagnostics():
+    """Show format hints for the Streamlit secrets."""
+    _validate_secrets(
+        st.secrets.get('OPENAI_API_KEY', ''),
+        st.secrets.get('PERPLEXITY_API_KEY', ''),
+        st.secrets.get('GOOGLE_SHEETS_SPREADSHEET_ID', ''),
+        st.secrets.get('GOOGLE_SERVICE_ACCOUNT_CREDENTIALS', '')
+    )
+
+def create_config_from_secrets():
+    """Create the config dict from Streamlit secrets."""
+    openai_key = st.secrets.get('OPENAI_API_KEY', '')
+    perplexity_key = st.secrets.get('PERPLEXITY_API_KEY', '')
+    gemini_key = st.secrets.get('GEMINI_API_KEY', '')
+    spreadsheet_id = st.secrets.get('GOOGLE_SHEETS_SPREADSHEET_ID', '')
     
-    config_content = f"""# Enhanced DataTobiz Brand Monitoring Configuration (Stage 2)
-# Generated from Streamlit secrets
-
-# LLM Configurations
-llm_configs:
-  openai:
-    name: "openai"
-    api_key: "{openai_key}"
-    model: "gpt-3.5-turbo"
-    max_tokens: 1000
-    temperature: 0.1
-    timeout: 30
-
-  perplexity:
-    name: "perplexity"
-    api_key: "{perplexity_key}"
-    model: "sonar"
-    max_tokens: 1000
-    temperature: 0.1
-    timeout: 30
-
-  gemini:
-    name: "gemini"
-    api_key: "{gemini_key}"
-    model: "gemini-pro"
-    max_tokens: 1000
-    temperature: 0.1
-    timeout: 30
-
-# Google Sheets Configuration
-google_sheets:
-  spreadsheet_id: "{spreadsheet_id}"
-  worksheet_name: "Brand_Monitoring_New"
-  credentials_file: "credentials.json"
-  auto_setup_headers: true
-  batch_size: 100
-  enable_validation: true
-
-# Brand Configuration
-brand:
-  target_brand: "DataTobiz"
-  brand_variations:
-    - "DataTobiz"
-    - "Data Tobiz"
-    - "data tobiz"
-    - "DATATOBIZ"
-    - "DataToBiz"
-    - "Data-Tobiz"
-    - "datatobiz.com"
-  case_sensitive: false
-  partial_match: true
-
-# Workflow Configuration
-workflow:
-  max_retries: 3
-  retry_delay: 1.0
-  parallel_execution: true
-  timeout_per_agent: 60
-  log_level: "INFO"
-
-# Stage 2 Configuration
-stage2:
-  enable_ranking_detection: true
-  enable_cost_tracking: true
-  enable_analytics: true
-  
-  ranking_detection:
-    max_position: 20
-    min_confidence: 0.6
-    enable_ordinal_detection: true
-    enable_list_detection: true
-    enable_keyword_detection: true
-    enable_numeric_detection: true
-
-# Enhanced Brand Configuration
-enhanced_brand:
-  context_analysis:
-    context_window: 200
-    enable_sentiment_analysis: false
-    positive_keywords:
-      - "excellent"
-      - "outstanding"
-      - "innovative"
-      - "reliable"
-      - "powerful"
-      - "comprehensive"
-      - "award-winning"
-      - "recognized"
-      - "trusted"
-      - "proven"
-    negative_keywords:
-      - "poor"
-      - "bad"
-      - "disappointing"
-      - "limited"
-      - "lacking"
-      - "outdated"
-      - "problematic"
-      - "difficult"
-      - "complex"
-      - "unreliable"
-"""
-    return config_content
+    return _build_config(openai_key, perplexity_key, gemini_key, spreadsheet_id)
 
-@st.cache_resource
 def create_api():
     """Create the brand monitoring API instance."""
+    # Deferred so the UI renders before the agent/storage stack is loaded
+    from main import EnhancedBrandMonitoringAPI
+    
     try:
         # Check secrets first
         secrets_status = check_streamlit_secrets()
@@ -346,23 +393,18 @@ def create_api():
             st.error("❌ Missing required secrets. Please configure all secrets in Streamlit Cloud.")
             return None
         
-        # Create temporary config file
-        config_content = create_config_from_secrets()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(config_content)
-            config_path = f.name
+        # Build config in memory from secrets
+        config_dict = create_config_from_secrets()
         
-        # Create credentials file
-        credentials_path = create_credentials_file()
-        if not credentials_path:
-            st.error("❌ Failed to create credentials file from secrets.")
+        # Load service account credentials
+        try:
+            credentials_info = get_credentials_info()
+        except json.JSONDecodeError as e:
+            st.error(f"❌ Google Service Account credentials are not valid JSON: {str(e)}")
             return None
         
-        # Create API with temporary config
-        api = EnhancedBrandMonitoringAPI(config_path)
-        
-        # Store the config path for later cleanup
-        api._temp_config_path = config_path
+        # Create API with in-memory config and credentials
+        api = EnhancedBrandMonitoringAPI(config_dict=config_dict, credentials_info=credentials_info)
         
         # Force reload Google Sheets config from environment variables
         if api.settings:
@@ -373,30 +415,429 @@ def create_api():
         st.error(f"Failed to create API instance: {str(e)}")
         return None
 
-async def initialize_api_async(api):
-    """Initialize the API asynchronously."""
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
+    """Start a process-wide event loop in a background thread."""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def submit_async(coro):
+    """Schedule a coroutine on the shared event loop and return its future."""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return submit_async(coro).result()
+
+def initialize_api(api):
+    """Initialize the API on the shared event loop."""
     try:
-        result = await api.initialize()
-        
-        # Clean up temporary config file after initialization
-        if hasattr(api, '_temp_config_path'):
-            try:
-                os.unlink(api._temp_config_path)
-                delattr(api, '_temp_config_path')
-            except:
-                pass
-        
-        return result
+        return run_async(api.initialize())
     except Exception as e:
         st.error(f"Failed to initialize API: {str(e)}")
         return False
 
+@st.cache_resource(show_spinner=False)
+def get_initialized_api():
+    """Create and initialize the API once per process, shared across sessions."""
+    api = create_api()
+    if api is None:
+        return None
+    
+    if not initialize_api(api):
+        return None
+    
+    return api
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_test_connections(_api):
+    """Run the API connection tests, reusing results for 30 seconds."""
+    return run_async(_api.test_connections())
+
+@st.cache_data(max_entries=RESULT_CACHE_SIZE, show_spinner=False)
+def _results_to_json(results_timestamp, _results):
+    """Serialize monitoring results once per run, keyed on the run timestamp."""
+    if orjson is not None:
+        return orjson.dumps(_results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(_results, indent=2, default=str)
+
+@st.cache_data(max_entries=RESULT_CACHE_SIZE, show_spinner=False)
+def _query_table_to_csv(results_timestamp, _query_df):
+    """Encode the per-query results table as CSV once per run, keyed on the run timestamp."""
+    return _query_df.write_csv().encode()
+
+# Column types for the detailed results tables (skips Polars type inference)
+_QUERY_RESULTS_SCHEMA = {"query": str, "found": bool, "confidence": float, "ranking": int}
+_AGENT_RESULTS_SCHEMA = {"query": str, "agent": str, "status": str, "found": bool}
+
+def _run_monitoring_with_progress(api, queries):
+    """Run monitoring for the queries, listing each query as it completes."""
+    # The workflow reports from the event loop thread; the script thread renders
+    progress_queue = queue.Queue()
+    future = submit_async(api.monitor_queries(
+        queries=queries,
+        mode="parallel",
+        enable_ranking=True,
+        enable_analytics=True,
+        progress_callback=lambda query, query_state: progress_queue.put((query, query_state.overall_found))
+    ))
+    
+    progress_placeholder = st.empty()
+    completed = []
+    while True:
+        done = future.done()
+        while not progress_queue.empty():
+            query, found = progress_queue.get_nowait()
+            completed.append(f"- {'✅' if found else '❌'} {query}")
+            progress_placeholder.markdown(
+                f"**Completed {len(completed)}/{len(queries)} queries**\n" + "\n".join(completed)
+            )
+        if done:
+            break
+        time.sleep(0.1)
+    
+    progress_placeholder.empty()
+    return future.result()
+
+def _results_cache_key(queries, max_results, search_depth):
+    """Build the session result cache key for a monitoring request."""
+    raw = "\n".join(queries) + f"|{max_results}|{search_depth}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+@st.cache_data(max_entries=RESULT_CACHE_SIZE, show_spinner=False)
+def _build_results_tables(results_timestamp, _query_results):
+    """Build the per-query and per-agent result tables, keyed on the run timestamp."""
+    import polars as pl
+    
+    query_rows = [
+        {
+            "query": query,
+            "found": bool(query_result.get('found')),
+            "confidence": (query_result.get('confidence') or 0.0) * 100,
+            "ranking": query_result.get('ranking'),
+        }
+        for query, query_result in _query_results.items()
+    ]
+    agent_rows = [
+        {
+            "query": query,
+            "agent": agent,
+            "status": "✅" if agent_result.get('status') == 'completed' else "❌",
+            "found": bool(agent_result.get('found', False)),
+        }
+        for query, query_result in _query_results.items()
+        for agent, agent_result in query_result.get('agents', {}).items()
+    ]
+    return (
+        pl.from_dicts(query_rows, schema=_QUERY_RESULTS_SCHEMA),
+        pl.from_dicts(agent_rows, schema=_AGENT_RESULTS_SCHEMA)
+    )
+
+_RESULTS_COLUMN_CONFIG = {
+    "confidence": st.column_config.NumberColumn("confidence", format="%.1f%%"),
+    "ranking": st.column_config.NumberColumn("ranking", format="%d"),
+}
+
+def _display_dataframe(df, max_rows=5000, height=400):
+    """Show at most max_rows rows of a DataFrame in a fixed-height grid."""
+    if df.height > max_rows:
+        st.caption(f"Showing first {max_rows:,} of {df.height:,} rows")
+        df = df.head(max_rows)
+    st.dataframe(
+        df,
+        use_container_width=True,
+        height=height,
+        hide_index=True,
+        column_config=_RESULTS_COLUMN_CONFIG
+    )
+
+def _render_summary_metrics(summary):
+    """Render the four summary metrics of a monitoring run."""
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Queries", summary.get('total_queries', 0))
+    with col2:
+        st.metric("Brand Mentions", summary.get('brand_mentions_found', 0))
+    with col3:
+        detection_rate = summary.get('brand_detection_rate') or 0
+        st.metric("Detection Rate", f"{detection_rate:.1%}")
+    with col4:
+        execution_time = summary.get('execution_time') or 0
+        st.metric("Execution Time", f"{execution_time:.2f}s")
+
+def _render_last_results():
+    """Render the metrics of the last monitoring run."""
+    results = st.session_state.last_results
+    if not results:
+        return
+    
+    st.markdown("#### 📊 Last Monitoring Results")
+    if results.get('success', False) and 'summary' in results:
+        _render_summary_metrics(results['summary'])
+
+@st.fragment
+def _render_monitoring_tab(api):
+    """Render the Brand Monitoring tab."""
+    st.markdown("### 🎯 Brand Monitoring")
+    
+    # Input for search queries (one per line)
+    search_query = st.text_area(
+        "Enter search queries for brand monitoring (one per line):",
+        placeholder="e.g., 'DataTobiz software development services'",
+        help="Enter one or more search queries to monitor for DataTobiz mentions"
+    )
+    queries = [line.strip() for line in search_query.splitlines() if line.strip()]
+    
+    # Search options
+    col1_1, col1_2 = st.columns(2)
+    with col1_1:
+        max_results = st.slider("Max Results", 5, 50, 10)
+    with col1_2:
+        search_depth = st.selectbox("Search Depth", ["Basic", "Comprehensive", "Deep Analysis"])
+    
+    reuse_results = st.checkbox(
+        "Reuse results for repeated queries",
+        value=True,
+        help="Show this session's earlier results for identical queries instead of querying the agents again"
+    )
+    
+    # Run monitoring
+    if st.button("🚀 Start Brand Monitoring", type="primary"):
+        if queries:
+            results = None
+            with st.spinner("🔍 Running brand monitoring analysis..."):
+                try:
+                    # Run the monitoring for all queries in one call (async)
+                    result_cache = st.session_state.result_cache
+                    cache_key = _results_cache_key(queries, max_results, search_depth)
+                    reused = reuse_results and cache_key in result_cache
+                    
+                    if reused:
+                        results = result_cache[cache_key]
+                        result_cache.move_to_end(cache_key)
+                    else:
+                        results = _run_monitoring_with_progress(api, queries)
+                        if results and results.get('success', False):
+                            result_cache[cache_key] = results
+                            result_cache.move_to_end(cache_key)
+                            if len(result_cache) > RESULT_CACHE_SIZE:
+                                result_cache.popitem(last=False)
+                except Exception as e:
+                    st.error(f"❌ Monitoring failed: {str(e)}")
+            
+            if results is not None:
+                st.session_state.last_results = results
+                st.session_state.last_results_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+                st.session_state.last_results_reused = reused
+                # Rerun the whole app so the Analytics tab picks up the new results
+                st.rerun(scope="app")
+        else:
+            st.warning("Please enter at least one search query.")
+    
+    # Display results of the last run
+    results = st.session_state.last_results
+    if not results:
+        return
+    
+    if not results.get('success', False):
+        st.error(f"❌ Monitoring failed: {results.get('error', 'Unknown error')}")
+        return
+    
+    if st.session_state.last_results_reused:
+        st.info("♻️ Showing cached results from an earlier run in this session.")
+    st.success("✅ Brand monitoring completed successfully!")
+    st.markdown("### 📈 Results")
+    
+    # Display summary
+    if 'summary' in results:
+        _render_summary_metrics(results['summary'])
+    
+    # Display detailed results
+    if 'results' in results:
+        st.markdown("### 📊 Detailed Results")
+        query_df, agent_df = _build_results_tables(results.get('timestamp'), results['results'])
+        _display_dataframe(query_df)
+        
+        # Agent breakdown
+        if agent_df.height:
+            st.markdown("**Agent Results:**")
+            _display_dataframe(agent_df)
+        
+        st.download_button(
+            label="📥 Download Results (CSV)",
+            data=_query_table_to_csv(results.get('timestamp'), query_df),
+            file_name=f"brand_monitoring_results_{st.session_state.last_results_ts}.csv",
+            mime="text/csv"
+        )
+    
+    # Download results
+    try:
+        json_data = _results_to_json(results.get('timestamp'), results)
+    except (TypeError, ValueError) as e:
+        st.warning(f"⚠️ JSON download unavailable: {str(e)}")
+    else:
+        st.download_button(
+            label="📥 Download Results (JSON)",
+            data=json_data,
+            file_name=f"brand_monitoring_results_{st.session_state.last_results_ts}.json",
+            mime="application/json"
+        )
+
+@st.fragment
+def _render_health_tab(api):
+    """Render the System Health tab."""
+    st.markdown("### 📊 System Health")
+    
+    # System health overview
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 🔧 System Status")
+        st.markdown('<span class="agent-status agent-online">✅ System Online</span>', unsafe_allow_html=True)
+        
+        # Agent status
+        st.markdown("#### 🤖 Agent Status")
+        agent_names = st.session_state.agent_names_tuple
+        if agent_names:
+            agents_html = "".join(
+                f'<span class="agent-status agent-online">✅ {agent_name}</span>'
+                for agent_name in agent_names
+            )
+            st.markdown(agents_html, unsafe_allow_html=True)
+        else:
+            st.markdown('<span class="agent-status agent-offline">❌ No agents available</span>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("#### 💾 Storage Status")
+        if api.workflow and api.workflow.storage_manager:
+            st.markdown('<span class="agent-status agent-online">✅ Google Sheets Connected</span>', unsafe_allow_html=True)
+        else:
+            st.markdown('<span class="agent-status agent-offline">❌ Storage not configured</span>', unsafe_allow_html=True)
+        
+        st.markdown("#### 📊 Analytics Status")
+        if api.workflow and api.workflow.analytics_engine:
+            st.markdown('<span class="agent-status agent-online">✅ Analytics Engine Ready</span>', unsafe_allow_html=True)
+        else:
+            st.markdown('<span class="agent-status agent-offline">❌ Analytics not available</span>', unsafe_allow_html=True)
+    
+    # Detailed health check
+    if st.button("🔍 Run Detailed Health Check"):
+        with st.spinner("Running comprehensive health check..."):
+            try:
+                status = cached_test_connections(api)
+                
+                if status.get('success', False):
+                    st.success("✅ All systems operational!")
+                    
+                    # Display detailed status
+                    st.markdown("#### 📋 Detailed Status Report")
+                    
+                    # Agents
+                    st.markdown("**🤖 Agents:**")
+                    st.markdown("\n".join(
+                        f"- ✅ {agent_name}: {agent_info.get('model', 'Unknown')}"
+                        if agent_info.get('healthy', False)
+                        else f"- ❌ {agent_name}: {agent_info.get('error', 'Failed')}"
+                        for agent_name, agent_info in status.get('agents', {}).items()
+                    ))
+                    
+                    # Storage
+                    st.markdown("**💾 Storage:**")
+                    storage_info = status.get('storage', {}).get('google_sheets', {})
+                    if storage_info.get('available', False):
+                        st.markdown(f"- ✅ Google Sheets: {storage_info.get('records_found', 'Unknown')} records")
+                    else:
+                        st.markdown(f"- ❌ Google Sheets: {storage_info.get('error', 'Not available')}")
+                    
+                    # Analytics
+                    st.markdown("**📊 Analytics:**")
+                    analytics_info = status.get('analytics', {}).get('engine', {})
+                    if analytics_info.get('available', False):
+                        st.markdown("- ✅ Analytics Engine: Ready")
+                    else:
+                        st.markdown(f"- ❌ Analytics Engine: {analytics_info.get('reason', 'Not available')}")
+                    
+                    # Stage 2 features
+                    st.markdown("**🎯 Stage 2 Features:**")
+                    stage2_features = status.get('stage2_features', {})
+                    st.markdown("\n".join(
+                        f"- {'✅' if enabled else '❌'} {feature}"
+                        for feature, enabled in stage2_features.items()
+                    ))
+                else:
+                    st.error(f"❌ Health check failed: {status.get('error', 'Unknown error')}")
+                    
+            except Exception as e:
+                st.error(f"❌ Health check failed: {str(e)}")
+    
+    # Debug section
+    with st.expander("🔧 Debug Information"):
+        st.markdown("#### 🔍 Secrets Debug")
+        debug_info = debug_secrets()
+        
+        st.markdown("**Available Secrets:**")
+        for secret in debug_info["available_secrets"]:
+            st.write(f"- {secret}")
+        
+        st.markdown("**Secret Status:**")
+        for secret_name, length_info in debug_info["secret_lengths"].items():
+            if length_info == "Not found":
+                st.markdown(f"- ❌ {secret_name}: Not configured")
+            else:
+                st.markdown(f"- ✅ {secret_name}: {length_info}")
+        
+        # Configuration debug
+        st.markdown("#### ⚙️ Configuration Debug")
+        if api and api.settings:
+            st.write("**Settings loaded:** ✅")
+            st.write(f"**Target brand:** {api.settings.brand.target_brand}")
+            st.write(f"**Spreadsheet ID:** {api.settings.google_sheets.spreadsheet_id}")
+            
+            # Debug environment variables
+            st.markdown("**Environment Variables:**")
+            st.write(f"GOOGLE_SHEETS_SPREADSHEET_ID: {os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID', 'Not found')}")
+            st.write(f"GOOGLE_SPREADSHEET_ID: {os.getenv('GOOGLE_SPREADSHEET_ID', 'Not found')}")
+            
+            # Debug Google Sheets config
+            st.markdown("**Google Sheets Config:**")
+            gs_config = api.settings.google_sheets
+            st.write(f"Spreadsheet ID: '{gs_config.spreadsheet_id}'")
+            credentials_source = "Streamlit secrets" if gs_config.credentials_info else f"'{gs_config.credentials_file}'"
+            st.write(f"Credentials: {credentials_source}")
+            st.write(f"Worksheet Name: '{gs_config.worksheet_name}'")
+            st.write(f"Auto Setup Headers: {gs_config.auto_setup_headers}")
+            st.write(f"Batch Size: {gs_config.batch_size}")
+            st.write(f"Enable Validation: {gs_config.enable_validation}")
+        else:
+            st.write("**Settings loaded:** ❌")
+        
+        # Workflow debug
+        st.markdown("#### 🔄 Workflow Debug")
+        if api and api.workflow:
+            st.write("**Workflow initialized:** ✅")
+            if st.session_state.agent_names_tuple:
+                st.write(f"**Available agents:** {list(st.session_state.agent_names_tuple)}")
+            else:
+                st.write("**Available agents:** None")
+            
+            if api.workflow.storage_manager:
+                st.write("**Storage manager:** ✅")
+            else:
+                st.write("**Storage manager:** ❌")
+        else:
+            st.write("**Workflow initialized:** ❌")
+
 def main():
     """Main application function."""
     st.markdown('<h1 class="main-header">🔍 DataTobiz Brand Monitoring System</h1>', unsafe_allow_html=True)
     
-    # Check secrets status
-    secrets_status = check_streamlit_secrets()
+    # Check secrets status (kept for the session once everything is configured)
+    secrets_status = st.session_state.secrets_status
+    if secrets_status is None:
+        secrets_status = check_streamlit_secrets()
+        if secrets_status["all_configured"]:
+            st.session_state.secrets_status = secrets_status
     
     if not secrets_status["all_configured"]:
         st.error("❌ **Configuration Required**")
@@ -419,363 +860,99 @@ def main():
         """)
         
         st.markdown("### Current Secret Status:")
-        for secret in secrets_status["configured_secrets"]:
-            st.markdown(f'<div class="secret-status secret-ok">✅ {secret}</div>', unsafe_allow_html=True)
-        for secret in secrets_status["missing_secrets"]:
-            st.markdown(f'<div class="secret-status secret-missing">❌ {secret}</div>', unsafe_allow_html=True)
+        badges_html = _render_secret_badges(
+            tuple(secrets_status["configured_secrets"]),
+            tuple(secrets_status["missing_secrets"])
+        )
+        st.markdown(badges_html, unsafe_allow_html=True)
         
         return
     
-    # Create API instance
-    if st.session_state.api is None:
-        st.session_state.api = create_api()
+    # Sidebar for controls
+    st.sidebar.title("🎛️ Control Panel")
     
-    if st.session_state.api is None:
-        st.error("Failed to create the system. Please check your configuration.")
-        return
+    # Secret format hints are opt-in
+    if st.sidebar.checkbox("Verbose config diagnostics", key='show_secret_debug'):
+        show_secret_diagnostics()
     
-    # Initialize API if not already initialized
-    if not st.session_state.initialized:
-        with st.spinner("🚀 Initializing Brand Monitoring System..."):
-            import asyncio
-            st.session_state.initialized = asyncio.run(initialize_api_async(st.session_state.api))
+    # Create and initialize API instance
+    with st.spinner("🚀 Initializing Brand Monitoring System..."):
+        api = get_initialized_api()
     
-    if not st.session_state.initialized:
+    if api is None:
+        # Don't keep a failed initialization cached for later reruns
+        get_initialized_api.clear()
         st.error("Failed to initialize the system. Please check your configuration.")
         return
     
-    # Sidebar for controls
-    st.sidebar.title("🎛️ Control Panel")
+    # Agent names don't change after initialization
+    if st.session_state.agent_names_tuple is None:
+        st.session_state.agent_names_tuple = tuple(api.workflow.agents.keys()) if api.workflow else ()
     
     # System Status
     st.sidebar.markdown("### 📊 System Status")
     
-    # Initialize button
-    if not st.session_state.initialized:
-        if st.sidebar.button("🚀 Initialize System", type="primary"):
-            with st.spinner("Initializing system..."):
-                import asyncio
-                st.session_state.initialized = asyncio.run(initialize_api_async(st.session_state.api))
-                if st.session_state.initialized:
-                    st.sidebar.success("✅ System initialized!")
-                    st.rerun()
-                else:
-                    st.sidebar.error("❌ Initialization failed!")
-    
     # System health status
-    if st.session_state.initialized:
-        st.sidebar.markdown('<span class="agent-status agent-online">✅ System Online</span>', unsafe_allow_html=True)
-        
-        # Test connections
-        if st.sidebar.button("🔍 Test Connections"):
-            with st.spinner("Testing system connections..."):
-                try:
-                    # Test API connections (async)
-                    import asyncio
-                    status = asyncio.run(st.session_state.api.test_connections())
+    st.sidebar.markdown('<span class="agent-status agent-online">✅ System Online</span>', unsafe_allow_html=True)
+    
+    # Test connections
+    if st.sidebar.button("🔍 Test Connections"):
+        with st.spinner("Testing system connections..."):
+            try:
+                # Test API connections (async)
+                status = cached_test_connections(api)
+                
+                if status.get('success', False):
+                    st.sidebar.success("✅ All connections successful!")
                     
-                    if status.get('success', False):
-                        st.sidebar.success("✅ All connections successful!")
-                        
-                        # Display agent status
-                        st.sidebar.markdown("### 🤖 Agent Status")
-                        for agent_name, agent_info in status.get('agents', {}).items():
-                            if agent_info.get('healthy', False):
-                                st.sidebar.markdown(f'<span class="agent-status agent-online">✅ {agent_name}</span>', unsafe_allow_html=True)
-                            else:
-                                st.sidebar.markdown(f'<span class="agent-status agent-offline">❌ {agent_name}</span>', unsafe_allow_html=True)
-                        
-                        # Display storage status
-                        st.sidebar.markdown("### 💾 Storage Status")
-                        storage_info = status.get('storage', {}).get('google_sheets', {})
-                        if storage_info.get('available', False):
-                            st.sidebar.markdown('<span class="agent-status agent-online">✅ Google Sheets</span>', unsafe_allow_html=True)
-                        else:
-                            st.sidebar.markdown('<span class="agent-status agent-offline">❌ Google Sheets</span>', unsafe_allow_html=True)
-                        
-                        # Display analytics status
-                        st.sidebar.markdown("### 📊 Analytics Status")
-                        analytics_info = status.get('analytics', {}).get('engine', {})
-                        if analytics_info.get('available', False):
-                            st.sidebar.markdown('<span class="agent-status agent-online">✅ Analytics Engine</span>', unsafe_allow_html=True)
-                        else:
-                            st.sidebar.markdown('<span class="agent-status agent-offline">❌ Analytics Engine</span>', unsafe_allow_html=True)
-                            
+                    # Display agent status
+                    st.sidebar.markdown("### 🤖 Agent Status")
+                    agents_html = "".join(
+                        f'<span class="agent-status agent-online">✅ {agent_name}</span>'
+                        if agent_info.get('healthy', False)
+                        else f'<span class="agent-status agent-offline">❌ {agent_name}</span>'
+                        for agent_name, agent_info in status.get('agents', {}).items()
+                    )
+                    st.sidebar.markdown(agents_html, unsafe_allow_html=True)
+                    
+                    # Display storage status
+                    st.sidebar.markdown("### 💾 Storage Status")
+                    storage_info = status.get('storage', {}).get('google_sheets', {})
+                    if storage_info.get('available', False):
+                        st.sidebar.markdown('<span class="agent-status agent-online">✅ Google Sheets</span>', unsafe_allow_html=True)
+                    else:
+                        st.sidebar.markdown('<span class="agent-status agent-offline">❌ Google Sheets</span>', unsafe_allow_html=True)
+                    
+                    # Display analytics status
+                    st.sidebar.markdown("### 📊 Analytics Status")
+                    analytics_info = status.get('analytics', {}).get('engine', {})
+                    if analytics_info.get('available', False):
+                        st.sidebar.markdown('<span class="agent-status agent-online">✅ Analytics Engine</span>', unsafe_allow_html=True)
                     else:
-                        st.sidebar.error(f"❌ Connection test failed: {status.get('error', 'Unknown error')}")
+                        st.sidebar.markdown('<span class="agent-status agent-offline">❌ Analytics Engine</span>', unsafe_allow_html=True)
                         
-                except Exception as e:
-                    st.sidebar.error(f"❌ Connection test failed: {str(e)}")
-    else:
-        st.sidebar.markdown('<span class="agent-status agent-offline">❌ System Offline</span>', unsafe_allow_html=True)
+                else:
+                    st.sidebar.error(f"❌ Connection test failed: {status.get('error', 'Unknown error')}")
+                    
+            except Exception as e:
+                st.sidebar.error(f"❌ Connection test failed: {str(e)}")
     
     # Main content area with tabs
     tab1, tab2, tab3 = st.tabs(["🎯 Brand Monitoring", "📊 System Health", "📈 Analytics"])
     
     with tab1:
-        st.markdown("### 🎯 Brand Monitoring")
-        
-        if not st.session_state.initialized:
-            st.warning("⚠️ Please initialize the system first using the sidebar button.")
-        else:
-            # Input for search query
-            search_query = st.text_input(
-                "Enter search query for brand monitoring:",
-                placeholder="e.g., 'DataTobiz software development services'",
-                help="Enter a search query to monitor for DataTobiz mentions"
-            )
-            
-            # Search options
-            col1_1, col1_2 = st.columns(2)
-            with col1_1:
-                max_results = st.slider("Max Results", 5, 50, 10)
-            with col1_2:
-                search_depth = st.selectbox("Search Depth", ["Basic", "Comprehensive", "Deep Analysis"])
-            
-            # Run monitoring
-            if st.button("🚀 Start Brand Monitoring", type="primary"):
-                if search_query:
-                    with st.spinner("🔍 Running brand monitoring analysis..."):
-                        try:
-                            # Run the monitoring (async)
-                            import asyncio
-                            results = asyncio.run(st.session_state.api.monitor_queries(
-                                queries=[search_query],
-                                mode="parallel",
-                                enable_ranking=True,
-                                enable_analytics=True
-                            ))
-                            
-                            st.session_state.last_results = results
-                            st.success("✅ Brand monitoring completed successfully!")
-                            
-                            # Display results
-                            if results and results.get('success', False):
-                                st.markdown("### 📈 Results")
-                                
-                                # Display summary
-                                if 'summary' in results:
-                                    summary = results['summary']
-                                    col1, col2, col3, col4 = st.columns(4)
-                                    with col1:
-                                        st.metric("Total Queries", summary.get('total_queries', 0))
-                                    with col2:
-                                        st.metric("Brand Mentions", summary.get('brand_mentions_found', 0))
-                                    with col3:
-                                        detection_rate = summary.get('brand_detection_rate', 0)
-                                        st.metric("Detection Rate", f"{detection_rate:.1%}")
-                                    with col4:
-                                        execution_time = summary.get('execution_time', 0)
-                                        st.metric("Execution Time", f"{execution_time:.2f}s")
-                                
-                                # Display detailed results
-                                if 'results' in results:
-                                    st.markdown("### 📊 Detailed Results")
-                                    for query, query_result in results['results'].items():
-                                        with st.expander(f"Query: {query}"):
-                                            found = "✅ Found" if query_result.get('found') else "❌ Not Found"
-                                            confidence = f"{query_result.get('confidence', 0):.1%}"
-                                            st.write(f"**Status:** {found}")
-                                            st.write(f"**Confidence:** {confidence}")
-                                            
-                                            if 'ranking' in query_result and query_result['ranking']:
-                                                st.write(f"**Ranking:** {query_result['ranking']}")
-                                            
-                                            # Agent breakdown
-                                            if 'agents' in query_result:
-                                                st.write("**Agent Results:**")
-                                                for agent, agent_result in query_result['agents'].items():
-                                                    status = "✅" if agent_result.get('status') == 'completed' else "❌"
-                                                    st.write(f"{status} {agent}: {agent_result.get('found', False)}")
-                                
-                                # Download results
-                                if results:
-                                    import json
-                                    json_data = json.dumps(results, indent=2)
-                                    st.download_button(
-                                        label="📥 Download Results (JSON)",
-                                        data=json_data,
-                                        file_name=f"brand_monitoring_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                                        mime="application/json"
-                                    )
-                            else:
-                                st.error(f"❌ Monitoring failed: {results.get('error', 'Unknown error')}")
-                            
-                        except Exception as e:
-                            st.error(f"❌ Monitoring failed: {str(e)}")
-                else:
-                    st.warning("Please enter a search query.")
+        _render_monitoring_tab(api)
     
     with tab2:
-        st.markdown("### 📊 System Health")
-        
-        if not st.session_state.initialized:
-            st.warning("⚠️ Please initialize the system first using the sidebar button.")
-        else:
-            # System health overview
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("#### 🔧 System Status")
-                st.markdown('<span class="agent-status agent-online">✅ System Online</span>', unsafe_allow_html=True)
-                
-                # Agent status
-                st.markdown("#### 🤖 Agent Status")
-                if st.session_state.api.workflow and st.session_state.api.workflow.agents:
-                    for agent_name in st.session_state.api.workflow.agents.keys():
-                        st.markdown(f'<span class="agent-status agent-online">✅ {agent_name}</span>', unsafe_allow_html=True)
-                else:
-                    st.markdown('<span class="agent-status agent-offline">❌ No agents available</span>', unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("#### 💾 Storage Status")
-                if st.session_state.api.workflow and st.session_state.api.workflow.storage_manager:
-                    st.markdown('<span class="agent-status agent-online">✅ Google Sheets Connected</span>', unsafe_allow_html=True)
-                else:
-                    st.markdown('<span class="agent-status agent-offline">❌ Storage not configured</span>', unsafe_allow_html=True)
-                
-                st.markdown("#### 📊 Analytics Status")
-                if st.session_state.api.workflow and st.session_state.api.workflow.analytics_engine:
-                    st.markdown('<span class="agent-status agent-online">✅ Analytics Engine Ready</span>', unsafe_allow_html=True)
-                else:
-                    st.markdown('<span class="agent-status agent-offline">❌ Analytics not available</span>', unsafe_allow_html=True)
-            
-            # Detailed health check
-            if st.button("🔍 Run Detailed Health Check"):
-                with st.spinner("Running comprehensive health check..."):
-                    try:
-                        import asyncio
-                        status = asyncio.run(st.session_state.api.test_connections())
-                        
-                        if status.get('success', False):
-                            st.success("✅ All systems operational!")
-                            
-                            # Display detailed status
-                            st.markdown("#### 📋 Detailed Status Report")
-                            
-                            # Agents
-                            st.markdown("**🤖 Agents:**")
-                            for agent_name, agent_info in status.get('agents', {}).items():
-                                if agent_info.get('healthy', False):
-                                    st.markdown(f"- ✅ {agent_name}: {agent_info.get('model', 'Unknown')}")
-                                else:
-                                    st.markdown(f"- ❌ {agent_name}: {agent_info.get('error', 'Failed')}")
-                            
-                            # Storage
-                            st.markdown("**💾 Storage:**")
-                            storage_info = status.get('storage', {}).get('google_sheets', {})
-                            if storage_info.get('available', False):
-                                st.markdown(f"- ✅ Google Sheets: {storage_info.get('records_found', 'Unknown')} records")
-                            else:
-                                st.markdown(f"- ❌ Google Sheets: {storage_info.get('error', 'Not available')}")
-                            
-                            # Analytics
-                            st.markdown("**📊 Analytics:**")
-                            analytics_info = status.get('analytics', {}).get('engine', {})
-                            if analytics_info.get('available', False):
-                                st.markdown("- ✅ Analytics Engine: Ready")
-                            else:
-                                st.markdown(f"- ❌ Analytics Engine: {analytics_info.get('reason', 'Not available')}")
-                            
-                            # Stage 2 features
-                            st.markdown("**🎯 Stage 2 Features:**")
-                            stage2_features = status.get('stage2_features', {})
-                            for feature, enabled in stage2_features.items():
-                                status_icon = "✅" if enabled else "❌"
-                                st.markdown(f"- {status_icon} {feature}")
-                        else:
-                            st.error(f"❌ Health check failed: {status.get('error', 'Unknown error')}")
-                            
-                    except Exception as e:
-                        st.error(f"❌ Health check failed: {str(e)}")
-            
-            # Debug section
-            with st.expander("🔧 Debug Information"):
-                st.markdown("#### 🔍 Secrets Debug")
-                debug_info = debug_secrets()
-                
-                st.markdown("**Available Secrets:**")
-                for secret in debug_info["available_secrets"]:
-                    st.write(f"- {secret}")
-                
-                st.markdown("**Secret Status:**")
-                for secret_name, length_info in debug_info["secret_lengths"].items():
-                    if length_info == "Not found":
-                        st.markdown(f"- ❌ {secret_name}: Not configured")
-                    else:
-                        st.markdown(f"- ✅ {secret_name}: {length_info}")
-                
-                # Configuration debug
-                st.markdown("#### ⚙️ Configuration Debug")
-                if st.session_state.api and st.session_state.api.settings:
-                    st.write("**Settings loaded:** ✅")
-                    st.write(f"**Target brand:** {st.session_state.api.settings.brand.target_brand}")
-                    st.write(f"**Spreadsheet ID:** {st.session_state.api.settings.google_sheets.spreadsheet_id}")
-                    
-                    # Debug environment variables
-                    st.markdown("**Environment Variables:**")
-                    import os
-                    st.write(f"GOOGLE_SHEETS_SPREADSHEET_ID: {os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID', 'Not found')}")
-                    st.write(f"GOOGLE_SPREADSHEET_ID: {os.getenv('GOOGLE_SPREADSHEET_ID', 'Not found')}")
-                    
-                    # Debug Google Sheets config
-                    st.markdown("**Google Sheets Config:**")
-                    gs_config = st.session_state.api.settings.google_sheets
-                    st.write(f"Spreadsheet ID: '{gs_config.spreadsheet_id}'")
-                    st.write(f"Credentials File: '{gs_config.credentials_file}'")
-                    st.write(f"Worksheet Name: '{gs_config.worksheet_name}'")
-                    st.write(f"Auto Setup Headers: {gs_config.auto_setup_headers}")
-                    st.write(f"Batch Size: {gs_config.batch_size}")
-                    st.write(f"Enable Validation: {gs_config.enable_validation}")
-                else:
-                    st.write("**Settings loaded:** ❌")
-                
-                # Workflow debug
-                st.markdown("#### 🔄 Workflow Debug")
-                if st.session_state.api and st.session_state.api.workflow:
-                    st.write("**Workflow initialized:** ✅")
-                    if st.session_state.api.workflow.agents:
-                        st.write(f"**Available agents:** {list(st.session_state.api.workflow.agents.keys())}")
-                    else:
-                        st.write("**Available agents:** None")
-                    
-                    if st.session_state.api.workflow.storage_manager:
-                        st.write("**Storage manager:** ✅")
-                    else:
-                        st.write("**Storage manager:** ❌")
-                else:
-                    st.write("**Workflow initialized:** ❌")
+        _render_health_tab(api)
     
     with tab3:
         st.markdown("### 📈 Analytics Dashboard")
         
-        if not st.session_state.initialized:
-            st.warning("⚠️ Please initialize the system first using the sidebar button.")
-        else:
-            st.info("📊 Analytics dashboard will show historical data and trends.")
-            
-            # Display last results if available
-            if st.session_state.last_results:
-                st.markdown("#### 📊 Last Monitoring Results")
-                results = st.session_state.last_results
-                
-                if results.get('success', False) and 'summary' in results:
-                    summary = results['summary']
-                    
-                    # Metrics
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("Total Queries", summary.get('total_queries', 0))
-                    with col2:
-                        st.metric("Brand Mentions", summary.get('brand_mentions_found', 0))
-                    with col3:
-                        detection_rate = summary.get('brand_detection_rate', 0)
-                        st.metric("Detection Rate", f"{detection_rate:.1%}")
-                    with col4:
-                        execution_time = summary.get('execution_time', 0)
-                        st.metric("Execution Time", f"{execution_time:.2f}s")
-    
-
+        st.info("📊 Analytics dashboard will show historical data and trends.")
+        
+        # Display last results if available
+        _render_last_results()
     
     # Footer
     st.markdown("---")
@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+
+import sys
+from pathlib import Path
+
+# Make the project root importable (main.py, src package)
+sys.path.insert(0, str(Path(__file__).parent.parent))
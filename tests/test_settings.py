@@ -0,0 +1,54 @@
+"""Tests for in-memory configuration loading."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import main
+from src.config import settings as settings_module
+from src.config.settings import get_settings
+
+CONFIG_DATA = {
+    "llm_configs": {
+        "openai": {"name": "openai", "api_key": "sk-test", "model": "gpt-3.5-turbo"},
+        "perplexity": {"name": "perplexity", "api_key": "pplx-test", "model": "sonar"},
+    },
+    "google_sheets": {
+        "spreadsheet_id": "sheet-123",
+        "worksheet_name": "From_Dict",
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_settings(monkeypatch):
+    """Start each test from the default settings singleton, as created at import time."""
+    for name in ("OPENAI_API_KEY", "PERPLEXITY_API_KEY", "GEMINI_API_KEY",
+                 "GOOGLE_SHEETS_SPREADSHEET_ID", "GOOGLE_SPREADSHEET_ID"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(settings_module, "settings", None)
+    get_settings()
+
+
+def test_get_settings_config_data_replaces_existing_instance():
+    settings = get_settings(config_data=CONFIG_DATA)
+    
+    assert settings.google_sheets.worksheet_name == "From_Dict"
+    assert settings.google_sheets.spreadsheet_id == "sheet-123"
+    assert get_settings() is settings
+
+
+def test_api_initialize_uses_config_dict(monkeypatch):
+    async def fake_workflow(settings):
+        return SimpleNamespace(agents={"openai": None, "perplexity": None})
+    
+    monkeypatch.setattr(main, "create_enhanced_workflow", fake_workflow)
+    
+    credentials_info = {"type": "service_account"}
+    api = main.EnhancedBrandMonitoringAPI(config_dict=CONFIG_DATA, credentials_info=credentials_info)
+    
+    assert asyncio.run(api.initialize())
+    assert api.settings.google_sheets.worksheet_name == "From_Dict"
+    assert api.settings.google_sheets.credentials_info == credentials_info
+    assert api.settings.openai_api_key == "sk-test"
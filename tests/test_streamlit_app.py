@@ -0,0 +1,48 @@
+"""Tests for the Streamlit app's in-memory configuration."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import main
+import streamlit_app
+from src.config import settings as settings_module
+from src.config.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_settings(monkeypatch):
+    """Start each test from the default settings singleton, as created at import time."""
+    for name in ("OPENAI_API_KEY", "PERPLEXITY_API_KEY", "GEMINI_API_KEY",
+                 "GOOGLE_SHEETS_SPREADSHEET_ID", "GOOGLE_SPREADSHEET_ID"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(settings_module, "settings", None)
+    get_settings()
+
+
+def test_build_config_reaches_api_settings(monkeypatch):
+    async def fake_workflow(settings):
+        return SimpleNamespace(agents={"openai": None, "perplexity": None, "gemini": None})
+    
+    monkeypatch.setattr(main, "create_enhanced_workflow", fake_workflow)
+    
+    config_dict = streamlit_app._build_config("sk-test", "pplx-test", "gm-test", "sheet-123")
+    api = main.EnhancedBrandMonitoringAPI(config_dict=config_dict)
+    
+    assert asyncio.run(api.initialize())
+    assert api.settings is get_settings()
+    assert api.settings.openai_api_key == "sk-test"
+    assert api.settings.perplexity_api_key == "pplx-test"
+    assert api.settings.gemini_api_key == "gm-test"
+    assert api.settings.google_sheets.spreadsheet_id == "sheet-123"
+    assert api.settings.google_sheets.worksheet_name == (
+        streamlit_app._CONFIG_TEMPLATE["google_sheets"]["worksheet_name"]
+    )
+
+
+def test_build_config_does_not_mutate_template():
+    streamlit_app._build_config("sk-test", "pplx-test", "gm-test", "sheet-123")
+    
+    assert streamlit_app._CONFIG_TEMPLATE["llm_configs"]["openai"]["api_key"] == ""
+    assert streamlit_app._CONFIG_TEMPLATE["google_sheets"]["spreadsheet_id"] == ""
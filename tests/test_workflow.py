@@ -0,0 +1,28 @@
+"""Tests for workflow progress reporting."""
+
+import asyncio
+
+from src.workflow.graph import EnhancedBrandMonitoringWorkflow
+from src.workflow.state import AgentStatus, dict_to_state
+
+
+def test_error_path_reports_progress_for_every_query():
+    workflow = EnhancedBrandMonitoringWorkflow()
+    
+    async def always_error(state):
+        workflow_state = dict_to_state(state)
+        if workflow_state.current_query_index >= len(workflow_state.queries):
+            return "complete"
+        return "error"
+    
+    workflow._decide_execution_mode = always_error
+    workflow._build_enhanced_graph()
+    
+    reported = []
+    asyncio.run(workflow.execute_enhanced_workflow(
+        ["a", "b", "c"],
+        enable_analytics=False,
+        progress_callback=lambda query, query_state: reported.append((query, query_state.status))
+    ))
+    
+    assert reported == [(query, AgentStatus.SKIPPED) for query in ("a", "b", "c")]